@@ -16,6 +16,8 @@ with NML; if not, write to the Free Software Foundation, Inc.,
 """
 Code for storing and generating action F
 """
+import bisect
+
 from nml import expression, generic, grfstrings
 from nml.actions import base_action
 
@@ -34,25 +36,21 @@ from nml.actions import base_action
 # a string (for a named number), or a (constant numeric) expression (for a safe/unsafe number).
 #
 total_numbers = 0x80
-free_numbers = set(range(total_numbers))  #: Free numbers.
-first_free_id = 0  #: All numbers before this are allocated.
+free_mask = (1 << total_numbers) - 1  #: Bitmap of free numbers, bit N is set if number N is free.
 named_numbers = {}  #: Mapping of names to named numbers. Note that these are always safe to refer to.
 numbered_numbers = set()  #: Safe numbers introduced by the user (without name).
 
 
 def get_free_id():
-    """Allocate a number from the free_numbers."""
-    global first_free_id
-    while first_free_id not in free_numbers:
-        first_free_id = first_free_id + 1
-        if first_free_id >= total_numbers:
-            raise generic.ScriptError(
-                "Too many town name blocks. Some of these are autogenerated. Please use less town names."
-            )
-    number = first_free_id
-    free_numbers.remove(number)
-    first_free_id = first_free_id + 1
-    return number
+    """Allocate the lowest number from the free_mask."""
+    global free_mask
+    lowest = free_mask & -free_mask
+    if lowest == 0:
+        raise generic.ScriptError(
+            "Too many town name blocks. Some of these are autogenerated. Please use less town names."
+        )
+    free_mask ^= lowest
+    return lowest.bit_length() - 1
 
 
 town_names_blocks = {}  # Mapping of town_names ID number to TownNames instance.
@@ -62,7 +60,7 @@ def print_stats():
     """
     Print statistics about used ids.
     """
-    num_used = total_numbers - len(free_numbers)
+    num_used = total_numbers - bin(free_mask).count("1")
     if num_used > 0:
         generic.print_info("Town names: {}/{}".format(num_used, total_numbers))
 
@@ -164,12 +162,11 @@ class ActionF(base_action.BaseAction):
         # Pull style names if needed.
         if self.style_name is not None:
             grfstrings.validate_string(self.style_name)
-            self.style_names = [
+            self.style_names = sorted(
                 (lang_id, grfstrings.get_translation(self.style_name, lang_id))
                 for lang_id in grfstrings.get_translations(self.style_name)
-            ]
-            self.style_names.append((0x7F, grfstrings.get_translation(self.style_name)))
-            self.style_names.sort()
+            )
+            bisect.insort(self.style_names, (0x7F, grfstrings.get_translation(self.style_name)))
             if len(self.style_names) == 0:
                 raise generic.ScriptError(
                     'Style "{}" defined, but no translations found for it'.format(self.style_name.name.value), self.pos
@@ -191,12 +188,15 @@ class ActionF(base_action.BaseAction):
         if len(self.style_names) == 0:
             return
 
+        print_bytex = handle.print_bytex
+        print_string = handle.print_string
+        newline = handle.newline
         for lang, txt in self.style_names:
-            handle.print_bytex(lang)
-            handle.print_string(txt, final_zero=True)
-            handle.newline()
-        handle.print_bytex(0)
-        handle.newline()
+            print_bytex(lang)
+            print_string(txt, final_zero=True)
+            newline()
+        print_bytex(0)
+        newline()
 
     # Parts
     def get_length_parts(self):
@@ -205,9 +205,10 @@ class ActionF(base_action.BaseAction):
 
     def write_parts(self, handle):
         handle.print_bytex(len(self.parts))
+        newline = handle.newline
         for part in self.parts:
             part.write(handle)
-            handle.newline()
+            newline()
 
     def write(self, handle):
         handle.start_sprite(2 + self.get_length_styles() + self.get_length_parts())
@@ -94,9 +94,9 @@ class TownNames(base_statement.BaseStatement):
             if self.id_number < 0 or self.id_number > 0x7F:
                 raise generic.ScriptError("ID must be a number between 0 and 0x7f (inclusive)", self.pos)
 
-            if self.id_number not in actionF.free_numbers:
+            if not actionF.free_mask & (1 << self.id_number):
                 raise generic.ScriptError("town names ID 0x{:x} is already used.".format(self.id_number), self.pos)
-            actionF.free_numbers.remove(self.id_number)
+            actionF.free_mask &= ~(1 << self.id_number)
 
     def __str__(self):
         ret = "town_names"
@@ -124,6 +124,9 @@ class TownNamesPart:
 
     @ivar num_bits: Number of bits to use, if defined.
     @type num_bits: C{int} or C{None}
+
+    @ivar length: Size of the part in the action F, computed by L{get_length}.
+    @type length: C{int} or C{None}
     """
 
     def __init__(self, pieces, pos):
@@ -132,6 +135,7 @@ class TownNamesPart:
 
         self.startbit = None
         self.num_bits = None
+        self.length = None
 
     def make_actions(self):
         """
@@ -276,9 +280,12 @@ class TownNamesPart:
         return "{{\n\t{}\n}}\n".format("\n\t".join(str(piece) for piece in self.pieces))
 
     def get_length(self):
-        size = 3  # textcount, firstbit, bitcount bytes.
-        size += sum(piece.get_length() for piece in self.pieces)
-        return size
+        # Pieces are final by the time the action F is written, but it may be written to multiple outputs.
+        if self.length is None:
+            size = 3  # textcount, firstbit, bitcount bytes.
+            size += sum(piece.get_length() for piece in self.pieces)
+            self.length = size
+        return self.length
 
     def resolve_townname_id(self):
         """
@@ -13,10 +13,9 @@ You should have received a copy of the GNU General Public License along
 with NML; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA."""
 
-import calendar
 import datetime
 import math
-from functools import reduce
+from functools import lru_cache
 
 from nml import generic, global_constants, nmlop
 
@@ -29,12 +28,21 @@ from .storage_op import StorageOp
 from .string_literal import StringLiteral
 from .abs_op import AbsOp
 
+# Number of days in each month, and in the year before the first day of each month, for non-leap years.
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_CUMDAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Sentinel for FunctionCall._builtin, to tell "not resolved yet" apart from "not a builtin" (None).
+# Otherwise it holds the function_table entry for the function.
+_UNSET = object()
+
 
 class FunctionCall(Expression):
     def __init__(self, name, params, pos):
         Expression.__init__(self, pos)
         self.name = name
         self.params = params
+        self._builtin = _UNSET
 
     def debug_print(self, indentation):
         generic.print_dbg(indentation, "Call function: " + self.name.value)
@@ -51,8 +59,11 @@ class FunctionCall(Expression):
         identifier.ignore_all_invalid_ids = True
         params = [param.reduce(id_dicts, unknown_id_fatal=False) for param in self.params]
         identifier.ignore_all_invalid_ids = False
-        if self.name.value in function_table:
-            func = function_table[self.name.value]
+        if self._builtin is _UNSET:
+            self._builtin = function_table.get(self.name.value)
+        if self._builtin is not None:
+            func, min_args, max_args = self._builtin
+            check_num_args(self.name.value, params, min_args, max_args, self.pos)
             val = func(self.name.value, params, self.pos)
             return val.reduce(id_dicts)
         else:
@@ -137,69 +148,114 @@ class GRMOp(Expression):
         return True
 
 
-function_table = {}
+function_table = {}  #: Mapping of function name to (function, min_args, max_args), max_args is None if unlimited.
 
 
-def builtin(func):
+def builtin(min_args=0, max_args=None):
     """
     Decorator that adds a function named `builtin_func` to the function table as `func`.
+
+    @param min_args: Minimum number of arguments of the function.
+    @type min_args: C{int}
+
+    @param max_args: Maximum number of arguments of the function, or C{None} for no maximum.
+    @type max_args: C{int} or C{None}
     """
-    assert func.__name__.startswith("builtin_")
-    name = func.__name__[8:]  # Strip the "builtin_". str.removeprefix() is only added in py3.9.
-    function_table[name] = func
-    return func
 
+    def dec(func):
+        assert func.__name__.startswith("builtin_")
+        name = func.__name__[8:]  # Strip the "builtin_". str.removeprefix() is only added in py3.9.
+        function_table[name] = (func, min_args, max_args)
+        return func
+
+    return dec
 
-def builtins(*names):
+
+def builtins(*names, min_args=0, max_args=None):
     """
     Decorator that adds a function to the function table with one or more custom names.
+    See L{builtin} for the meaning of C{min_args} and C{max_args}.
     """
 
     def dec(func):
         for name in names:
-            function_table[name] = func
+            function_table[name] = (func, min_args, max_args)
         return func
 
     return dec
 
 
+def check_num_args(name, args, min_args, max_args, pos):
+    """
+    Check that a builtin function is called with an allowed number of arguments.
+
+    @param name: Name of the function.
+    @type name: C{str}
+
+    @param args: Arguments passed to the function.
+    @type args: C{list} of L{Expression}
+
+    @param min_args: Minimum number of arguments.
+    @type min_args: C{int}
+
+    @param max_args: Maximum number of arguments, or C{None} for no maximum.
+    @type max_args: C{int} or C{None}
+
+    @param pos: Position information of the function call.
+    @type pos: L{Position}
+    """
+    if min_args <= len(args) and (max_args is None or len(args) <= max_args):
+        return
+    if max_args is None:
+        expected = "at least {:d}".format(min_args)
+    elif min_args == max_args:
+        expected = "exactly {:d}".format(min_args)
+    elif min_args + 1 == max_args:
+        expected = "{:d} or {:d}".format(min_args, max_args)
+    else:
+        expected = "{:d} to {:d}".format(min_args, max_args)
+    plural = "" if (max_args if max_args is not None else min_args) == 1 else "s"
+    raise generic.ScriptError("{}() must have {} parameter{}".format(name, expected, plural), pos)
+
+
 # { Builtin functions
 
 
-@builtin
+@builtin(2, None)
 def builtin_min(name, args, pos):
     """
     min(...) builtin function.
 
     @return Lowest value of the given arguments.
     """
-    if len(args) < 2:
-        raise generic.ScriptError("min() requires at least 2 arguments", pos)
-    return reduce(lambda x, y: nmlop.MIN(x, y, pos), args)
+    min_op = nmlop.MIN
+    res = args[0]
+    for arg in args[1:]:
+        res = min_op(res, arg, pos)
+    return res
 
 
-@builtin
+@builtin(2, None)
 def builtin_max(name, args, pos):
     """
     max(...) builtin function.
 
     @return Highest value of the given arguments.
     """
-    if len(args) < 2:
-        raise generic.ScriptError("max() requires at least 2 arguments", pos)
-    return reduce(lambda x, y: nmlop.MAX(x, y, pos), args)
+    max_op = nmlop.MAX
+    res = args[0]
+    for arg in args[1:]:
+        res = max_op(res, arg, pos)
+    return res
 
 
-@builtin
+@builtin(3, 3)
 def builtin_date(name, args, pos):
     """
     date(year, month, day) builtin function.
 
     @return Days since 1 jan 1 of the given date.
     """
-    days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    if len(args) != 3:
-        raise generic.ScriptError("date() requires exactly 3 arguments", pos)
     identifier.ignore_all_invalid_ids = True
     year = args[0].reduce(global_constants.const_list)
     identifier.ignore_all_invalid_ids = False
@@ -209,7 +265,7 @@ def builtin_date(name, args, pos):
     except generic.ConstError:
         raise generic.ScriptError("Month and day parameters of date() should be compile-time constants", pos)
     generic.check_range(month, 1, 12, "month", args[1].pos)
-    generic.check_range(day, 1, days_in_month[month - 1], "day", args[2].pos)
+    generic.check_range(day, 1, _DAYS_IN_MONTH[month - 1], "day", args[2].pos)
 
     if not isinstance(year, ConstantNumeric):
         if month != 1 or day != 1:
@@ -227,25 +283,35 @@ def builtin_date(name, args, pos):
         return res
 
     generic.check_range(year.value, 0, 5000000, "year", year.pos)
-    day_in_year = 0
-    for i in range(month - 1):
-        day_in_year += days_in_month[i]
-    day_in_year += day
-    if month >= 3 and (year.value % 4 == 0) and ((not year.value % 100 == 0) or (year.value % 400 == 0)):
+    return ConstantNumeric(_days_since_year_zero(year.value, month, day), pos)
+
+
+@lru_cache(maxsize=4096)
+def _days_since_year_zero(year, month, day):
+    """
+    Compute the value of date(year, month, day) for a valid, constant date.
+
+    @return Days since 1 jan 1 of the given date.
+    """
+    day_in_year = _CUMDAYS[month - 1] + day
+    if month >= 3 and _is_leap(year):
         day_in_year += 1
-    return ConstantNumeric(year.value * 365 + calendar.leapdays(0, year.value) + day_in_year - 1, pos)
+    # Number of leap years in [0, year), i.e. the number of multiples of 4, 100 and 400 below year
+    leap_days = (year + 3) // 4 - (year + 99) // 100 + (year + 399) // 400
+    return year * 365 + leap_days + day_in_year - 1
+
+
+def _is_leap(year):
+    return (year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0))
 
 
-@builtin
+@builtin(2, 2)
 def builtin_day_of_year(name, args, pos):
     """
     day_of_year(month, day) builtin function.
 
     @return Day of the year, assuming February has 28 days.
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have a month and a day parameter", pos)
-
     month = args[0].reduce()
     if not isinstance(month, ConstantNumeric):
         raise generic.ScriptError("Month should be a compile-time constant.", month.pos)
@@ -261,7 +327,17 @@ def builtin_day_of_year(name, args, pos):
     if day.value < 1 or day.value > number_days[month.value]:
         raise generic.ScriptError("Day should be value between 1 and {:d}.".format(number_days[month.value]), day.pos)
 
-    return ConstantNumeric(datetime.date(1, month.value, day.value).toordinal(), pos)
+    return ConstantNumeric(_day_of_year(month.value, day.value), pos)
+
+
+@lru_cache(maxsize=512)
+def _day_of_year(month, day):
+    """
+    Compute the value of day_of_year(month, day) for a valid, constant month and day.
+
+    @return Day of the year, assuming February has 28 days.
+    """
+    return datetime.date(1, month, day).toordinal()
 
 
 @builtins("STORE_TEMP", "STORE_PERM", "LOAD_TEMP", "LOAD_PERM")
@@ -272,45 +348,37 @@ def builtin_storage(name, args, pos):
     return StorageOp(name, args, pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_UCMP(name, args, pos):
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have exactly two parameters", pos)
     return nmlop.VACT2_UCMP(args[0], args[1], pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_CMP(name, args, pos):
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have exactly two parameters", pos)
     return nmlop.VACT2_CMP(args[0], args[1], pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_rotate(name, args, pos):
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have exactly two parameters", pos)
     return nmlop.ROT_RIGHT(args[0], args[1], pos)
 
 
-@builtin
+@builtin()
 def builtin_bitmask(name, args, pos):
     return BitMask(args, pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_hasbit(name, args, pos):
     """
     hasbit(value, bit_num) builtin function.
 
     @return C{1} if and only if C{value} has bit C{bit_num} set, C{0} otherwise.
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have exactly two parameters", pos)
     return nmlop.HASBIT(args[0], args[1], pos)
 
 
-@builtin
+@builtin(3, 3)
 def builtin_getbits(name, args, pos):
     """
     getbits(value, first, amount) builtin function.
@@ -318,9 +386,6 @@ def builtin_getbits(name, args, pos):
     @return Extract C{amount} bits starting at C{first} from C{value},
             that is (C{value} >> C{first}) & (1 << C{amount} - 1)
     """
-    if len(args) != 3:
-        raise generic.ScriptError(name + "() must have exactly three parameters", pos)
-
     # getbits(value, first, amount) = (value >> first) & ((0xFFFFFFFF << amount) ^ 0xFFFFFFFF)
     part1 = nmlop.SHIFTU_RIGHT(args[0], args[1], pos)
     part2 = nmlop.SHIFT_LEFT(0xFFFFFFFF, args[2], pos)
@@ -329,7 +394,7 @@ def builtin_getbits(name, args, pos):
     return nmlop.AND(part1, part3, pos)
 
 
-@builtin
+@builtin(2, 4)
 def builtin_version_openttd(name, args, pos):
     """
     version_openttd(major, minor[, revision[, build]]) builtin function.
@@ -339,9 +404,6 @@ def builtin_version_openttd(name, args, pos):
 
     @return The version information encoded in a double-word.
     """
-    if len(args) < 2:
-        raise generic.ScriptError(name + "() must have at least 2 parameters", pos)
-
     major = args[0].reduce_constant().value
     minor = args[1].reduce_constant().value
 
@@ -351,65 +413,66 @@ def builtin_version_openttd(name, args, pos):
 
         return ConstantNumeric(((16 + major) << 24) | (minor << 20))
     else:
-        if len(args) > 4:
-            raise generic.ScriptError(name + "() must have at most 4 parameters", pos)
-
         revision = args[2].reduce_constant().value if len(args) >= 3 else 0
         build = args[3].reduce_constant().value if len(args) >= 4 else 0x80000
         return ConstantNumeric((major << 28) | (minor << 24) | (revision << 20) | build)
 
 
-@builtins("cargotype_available", "railtype_available", "roadtype_available", "tramtype_available")
+# Action7/9 operator of the {cargo|rail|road|tram}type_available functions.
+_TYPELABEL_AVAILABLE = {
+    "cargotype_available": (0x0B, r"\7c"),
+    "railtype_available": (0x0D, None),
+    "roadtype_available": (0x0F, None),
+    "tramtype_available": (0x11, None),
+}
+
+
+@builtins(
+    "cargotype_available", "railtype_available", "roadtype_available", "tramtype_available", min_args=1, max_args=1
+)
 def builtin_typelabel_available(name, args, pos):
     """
     {cargo|rail|road|tram}type_available(label) builtin functions.
 
     @return 1 if the label is available, 0 otherwise.
     """
-    op = {
-        "cargotype_available": (0x0B, r"\7c"),
-        "railtype_available": (0x0D, None),
-        "roadtype_available": (0x0F, None),
-        "tramtype_available": (0x11, None),
-    }[name]
-
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have exactly 1 parameter", pos)
+    op = _TYPELABEL_AVAILABLE[name]
     label = args[0].reduce()
     return SpecialCheck(op, 0, (0, 1), parse_string_to_dword(label), "{}({})".format(name, label), pos=args[0].pos)
 
 
-@builtins("grf_current_status", "grf_future_status", "grf_order_behind")
+# Action7/9 operator and results of the grf_{current_status|future_status|order_behind} functions.
+_GRF_STATUS = {
+    # can't use \7g (0, 1), because that's false when the queried grf isn't present at all.
+    "grf_current_status": ((0x06, r"\7G"), (1, 0)),
+    "grf_future_status": ((0x0A, r"\7gg"), (0, 1)),
+    "grf_order_behind": ((0x08, r"\7gG"), (0, 1)),
+}
+
+
+@builtins("grf_current_status", "grf_future_status", "grf_order_behind", min_args=1, max_args=2)
 def builtin_grf_status(name, args, pos):
     """
     grf_{current_status|future_status|order_behind}(grfid[, mask]) builtin functions.
 
     @return 1 if the grf is, or will be, active, 0 otherwise.
     """
-    op, results = {
-        # can't use \7g (0, 1), because that's false when the queried grf isn't present at all.
-        "grf_current_status": ((0x06, r"\7G"), (1, 0)),
-        "grf_future_status": ((0x0A, r"\7gg"), (0, 1)),
-        "grf_order_behind": ((0x08, r"\7gG"), (0, 1)),
-    }[name]
+    op, results = _GRF_STATUS[name]
 
+    grfid = args[0].reduce()
     if len(args) == 1:
-        grfid = args[0].reduce()
         mask = None
         string = "{}({})".format(name, grfid)
         varsize = 4
-    elif len(args) == 2:
-        grfid = args[0].reduce()
+    else:
         mask = parse_string_to_dword(args[1].reduce())
         string = "{}({}, {})".format(name, grfid, mask)
         varsize = 8
-    else:
-        raise generic.ScriptError(name + "() must have 1 or 2 parameters", pos)
 
     return SpecialCheck(op, 0x88, results, parse_string_to_dword(grfid), string, varsize, mask, args[0].pos)
 
 
-@builtins("visual_effect", "visual_effect_and_powered")
+@builtins("visual_effect", "visual_effect_and_powered", min_args=2, max_args=3)
 def builtin_visual_effect_and_powered(name, args, pos):
     """
     Builtin function, used in two forms:
@@ -420,6 +483,7 @@ def builtin_visual_effect_and_powered(name, args, pos):
 
     """
     arg_len = 2 if name == "visual_effect" else 3
+    # The function table only knows both forms take 2 or 3 parameters
     if len(args) != arg_len:
         raise generic.ScriptError(name + "() must have {:d} parameters".format(arg_len), pos)
     effect = args[0].reduce_constant(global_constants.const_list).value
@@ -438,7 +502,7 @@ def builtin_visual_effect_and_powered(name, args, pos):
     return ConstantNumeric(effect | offset | powered)
 
 
-@builtin
+@builtin(4, 4)
 def builtin_create_effect(name, args, pos):
     """
     Builtin function:
@@ -447,9 +511,6 @@ def builtin_create_effect(name, args, pos):
     in the callback create_effect
 
     """
-    if len(args) != 4:
-        raise generic.ScriptError(name + "() must have 4 parameters", pos)
-
     sprite = args[0].reduce_constant(global_constants.const_list).value
     offset1 = args[1].reduce_constant().value
     offset2 = args[2].reduce_constant().value
@@ -463,14 +524,12 @@ def builtin_create_effect(name, args, pos):
     return ConstantNumeric(sprite | (offset1 & 0xFF) << 8 | (offset2 & 0xFF) << 16 | (offset3 & 0xFF) << 24)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_str2number(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     return ConstantNumeric(parse_string_to_dword(args[0]))
 
 
-@builtins("badgetype", "cargotype", "railtype", "roadtype", "tramtype")
+@builtins("badgetype", "cargotype", "railtype", "roadtype", "tramtype", min_args=1, max_args=1)
 def builtin_resolve_typelabel(name, args, pos, table_name=None):
     """
     {cargo,rail,road,tram}type(label) builtin functions.
@@ -493,6 +552,7 @@ def builtin_resolve_typelabel(name, args, pos, table_name=None):
     if table_name == "badgetype":
         table_name = "badge"
 
+    # Also checked by FunctionCall.reduce, but this function is called directly for Action2Var variables
     if len(args) != 1:
         raise generic.ScriptError(name + "() must have 1 parameter", pos)
     if not isinstance(args[0], StringLiteral) or args[0].value not in table:
@@ -502,24 +562,19 @@ def builtin_resolve_typelabel(name, args, pos, table_name=None):
     return ConstantNumeric(table[args[0].value])
 
 
-@builtin
+@builtin(1, 1)
 def builtin_reserve_sprites(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     count = args[0].reduce_constant()
     return GRMOp(nmlop.GRM_RESERVE, 0x08, count.value, lambda x: "{}({:d})".format(name, count.value), pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_industry_type(name, args, pos):
     """
     industry_type(IND_TYPE_OLD | IND_TYPE_NEW, id) builtin function
 
     @return The industry type in the format used by grfs (industry prop 0x16 and var 0x64)
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have 2 parameters", pos)
-
     type = args[0].reduce_constant(global_constants.const_list).value
     if type not in (0, 1):
         raise generic.ScriptError("First argument of industry_type() must be IND_TYPE_OLD or IND_TYPE_NEW", pos)
@@ -532,11 +587,8 @@ def builtin_industry_type(name, args, pos):
     return ConstantNumeric(type << 7 | id)
 
 
-@builtins("accept_cargo", "produce_cargo")
+@builtins("accept_cargo", "produce_cargo", min_args=1, max_args=None)
 def builtin_cargoexpr(name, args, pos):
-    if len(args) < 1:
-        raise generic.ScriptError(name + "() must have 1 or more parameters", pos)
-
     if not isinstance(args[0], StringLiteral) or args[0].value not in global_constants.cargo_numbers:
         raise generic.ScriptError(
             "First argument of " + name + "() must be a string literal that is also in your cargo table", pos
@@ -551,10 +603,8 @@ def builtin_cargoexpr(name, args, pos):
         raise AssertionError()
 
 
-@builtins("acos", "asin", "atan", "cos", "sin", "sqrt", "tan")
+@builtins("acos", "asin", "atan", "cos", "sin", "sqrt", "tan", min_args=1, max_args=1)
 def builtin_math(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     val = args[0].reduce()
     if not isinstance(val, (ConstantNumeric, ConstantFloat)):
         raise generic.ScriptError("Parameter for " + name + "() must be a constant", pos)
@@ -570,37 +620,29 @@ def builtin_math(name, args, pos):
     return ConstantFloat(math_func_table[name](val.value), val.pos)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_round(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     val = args[0].reduce()
     if not isinstance(val, (ConstantNumeric, ConstantFloat)):
         raise generic.ScriptError("Parameter for " + name + "() must be a constant", pos)
     return ConstantNumeric(round(val.value), pos)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_int(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     val = args[0].reduce()
     if not isinstance(val, (ConstantNumeric, ConstantFloat)):
         raise generic.ScriptError("Parameter for " + name + "() must be a constant", pos)
     return ConstantNumeric(int(val.value), val.pos)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_abs(name, args, pos):
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
     return AbsOp(args[0], args[0].pos).reduce()
 
 
-@builtin
+@builtin(1, 2)
 def builtin_sound(name, args, pos):
-    if len(args) not in (1, 2):
-        raise generic.ScriptError(name + "() must have 1 or 2 parameters", pos)
     if not isinstance(args[0], StringLiteral):
         raise generic.ScriptError("Parameter for " + name + "() must be a string literal", pos)
     volume = args[1].reduce_constant().value if len(args) >= 2 else 100
@@ -610,10 +652,8 @@ def builtin_sound(name, args, pos):
     return ConstantNumeric(action11.add_sound((args[0].value, volume), pos), pos)
 
 
-@builtin
+@builtin(2, 3)
 def builtin_import_sound(name, args, pos):
-    if len(args) not in (2, 3):
-        raise generic.ScriptError(name + "() must have 2 or 3 parameters", pos)
     grfid = parse_string_to_dword(args[0].reduce())
     sound_num = args[1].reduce_constant().value
     volume = args[2].reduce_constant().value if len(args) >= 3 else 100
@@ -623,16 +663,13 @@ def builtin_import_sound(name, args, pos):
     return ConstantNumeric(action11.add_sound((grfid, sound_num, volume), pos), pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_relative_coord(name, args, pos):
     """
     relative_coord(x, y) builtin function.
 
     @return Coordinates in 0xYYXX format.
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have x and y coordinates as parameters", pos)
-
     if isinstance(args[0], ConstantNumeric):
         generic.check_range(args[0].value, 0, 255, "Argument of '{}'".format(name), args[0].pos)
     if isinstance(args[1], ConstantNumeric):
@@ -646,7 +683,7 @@ def builtin_relative_coord(name, args, pos):
     return nmlop.OR(x_coord, y_coord, pos)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_num_corners_raised(name, args, pos):
     """
     num_corners_raised(slope) builtin function.
@@ -654,9 +691,6 @@ def builtin_num_corners_raised(name, args, pos):
 
     @return Number of raised corners in a slope (4 for steep slopes)
     """
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
-
     slope = args[0]
     # The returned value is ((slope x 0x8421) & 0x11111) % 0xF
     # Explanation in steps: (numbers in binary)
@@ -671,16 +705,13 @@ def builtin_num_corners_raised(name, args, pos):
     return nmlop.MOD(slope, 0xF)
 
 
-@builtin
+@builtin(1, 1)
 def builtin_slope_to_sprite_offset(name, args, pos):
     """
     builtin function slope_to_sprite_offset(slope)
 
     @return sprite offset to use
     """
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
-
     if isinstance(args[0], ConstantNumeric):
         generic.check_range(args[0].value, 0, 15, "Argument of '{}'".format(name), args[0].pos)
 
@@ -697,32 +728,26 @@ def builtin_slope_to_sprite_offset(name, args, pos):
     return expr
 
 
-@builtin
+@builtin(1, 1)
 def builtin_palette_1cc(name, args, pos):
     """
     palette_1cc(colour) builtin function.
 
     @return Recolour sprite to use
     """
-    if len(args) != 1:
-        raise generic.ScriptError(name + "() must have 1 parameter", pos)
-
     if isinstance(args[0], ConstantNumeric):
         generic.check_range(args[0].value, 0, 15, "Argument of '{}'".format(name), args[0].pos)
 
     return nmlop.ADD(args[0], 775, pos)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_palette_2cc(name, args, pos):
     """
     palette_2cc(colour1, colour2) builtin function.
 
     @return Recolour sprite to use
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have 2 parameters", pos)
-
     for i in range(0, 2):
         if isinstance(args[i], ConstantNumeric):
             generic.check_range(args[i].value, 0, 15, "Argument of '{}'".format(name), args[i].pos)
@@ -735,16 +760,13 @@ def builtin_palette_2cc(name, args, pos):
     return nmlop.ADD(col12, base)
 
 
-@builtin
+@builtin(2, 2)
 def builtin_vehicle_curv_info(name, args, pos):
     """
     vehicle_curv_info(prev_cur, cur_next) builtin function
 
     @return Value to use with vehicle var curv_info
     """
-    if len(args) != 2:
-        raise generic.ScriptError(name + "() must have 2 parameters", pos)
-
     for arg in args:
         if isinstance(arg, ConstantNumeric):
             generic.check_range(arg.value, -2, 2, "Argument of '{}'".format(name), arg.pos)
@@ -754,16 +776,13 @@ def builtin_vehicle_curv_info(name, args, pos):
     return nmlop.OR(args[0], cur_next)
 
 
-@builtin
+@builtin(1, None)
 def builtin_format_string(name, args, pos):
     """
     format_string(format, ... args ..) builtin function
 
     @return Formatted string
     """
-    if len(args) < 1:
-        raise generic.ScriptError(name + "() must have at least one parameter", pos)
-
     format = args[0].reduce()
     if not isinstance(format, StringLiteral):
         raise generic.ScriptError(name + "() parameter 1 'format' must be a literal string", format.pos)
@@ -13,6 +13,8 @@ You should have received a copy of the GNU General Public License along
 with NML; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA."""
 
+from functools import lru_cache
+
 from nml import generic, grfstrings
 
 from .base_expression import ConstantNumeric, Expression, Type
@@ -108,22 +110,42 @@ def parse_string_to_dword(string):
     @return: Value of the converted expression (a 32-bit integer number, little endian).
     @rtype:  C{int}
     """
-    if not isinstance(string, StringLiteral) or grfstrings.get_string_size(string.value, False, True) != 4:
+    if not isinstance(string, StringLiteral):
+        raise generic.ScriptError("Expected a string literal of length 4", string.pos)
+    try:
+        value = _string_to_dword(string.value)
+    except ValueError:
+        raise generic.ScriptError("Cannot convert string to integer id", string.pos)
+    if value is None:
         raise generic.ScriptError("Expected a string literal of length 4", string.pos)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _string_to_dword(string):
+    """
+    Convert the value of a string literal to its equivalent 32-bit number.
+    Labels and GRFIDs are converted many times, so results are cached.
+
+    @param string: Value of the string literal.
+    @type  string: C{str}
+
+    @return: Value of the string (a 32-bit integer number, little endian), or C{None} if it is not 4 bytes long.
+    @rtype:  C{int} or C{None}
+
+    @raise ValueError: The string contains an invalid escape sequence.
+    """
+    if grfstrings.get_string_size(string, False, True) != 4:
+        return None
 
-    pos = string.pos
-    string = string.value
     bytes = []
     i = 0
-    try:
-        while len(bytes) < 4:
-            if string[i] == "\\":
-                bytes.append(int(string[i + 1 : i + 3], 16))
-                i += 3
-            else:
-                bytes.append(ord(string[i]))
-                i += 1
-    except ValueError:
-        raise generic.ScriptError("Cannot convert string to integer id", pos)
+    while len(bytes) < 4:
+        if string[i] == "\\":
+            bytes.append(int(string[i + 1 : i + 3], 16))
+            i += 3
+        else:
+            bytes.append(ord(string[i]))
+            i += 1
 
     return bytes[0] | (bytes[1] << 8) | (bytes[2] << 16) | (bytes[3] << 24)
@@ -14,25 +14,42 @@ with NML; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA."""
 
 # -*- coding: utf-8 -*-
-import io
+from functools import lru_cache
 
-from nml import generic, grfstrings, output_base
+from nml import grfstrings, output_base
 from nml.actions import real_sprite
 
+# Sprite line tokens, including the trailing separator
 zoom_levels = {
-    0: "normal",
-    1: "zi4",
-    2: "zi2",
-    3: "zo2",
-    4: "zo4",
-    5: "zo8",
+    0: "normal ",
+    1: "zi4 ",
+    2: "zi2 ",
+    3: "zo2 ",
+    4: "zo4 ",
+    5: "zo8 ",
 }
 
 bit_depths = {
-    8: "8bpp",
-    32: "32bpp",
+    8: "8bpp ",
+    32: "32bpp ",
 }
 
+# Preformatted output of print_bytex, indexed by byte value
+_HEXBYTE = tuple("{:02X} ".format(i) for i in range(256))
+
+# Output of print_wordx, filled on demand
+_hexword = {}
+
+
+@lru_cache(maxsize=8192)
+def _string_info(value, force_ascii):
+    """
+    Get whether a string is ascii-only, and its size in bytes without the final zero.
+
+    @raise generic.ScriptError: force_ascii and the string is not ascii-only.
+    """
+    return grfstrings.is_ascii_string(value), grfstrings.get_string_size(value, False, force_ascii)
+
 
 class OutputNFO(output_base.SpriteOutputBase):
     def __init__(self, filename, start_sprite_num):
@@ -40,7 +57,8 @@ class OutputNFO(output_base.SpriteOutputBase):
         self.sprite_num = start_sprite_num
 
     def open(self):
-        self.file = io.StringIO()
+        # Output is collected as a list of string fragments, joined once in assemble_file
+        self.file = []
 
     def open_file(self):
         handle = open(self.filename, "w", encoding="utf-8")
@@ -57,70 +75,68 @@ class OutputNFO(output_base.SpriteOutputBase):
 
     def assemble_file(self, real_file):
         # All print functions add a space in case there's something written after so remove trailing whitespaces
-        real_file.write(self.file.getvalue().replace(" \n", "\n"))
+        real_file.write("".join(self.file).replace(" \n", "\n"))
 
     def print_byte(self, value):
         value = self.prepare_byte(value)
-        self.file.write("\\b" + str(value) + " ")
+        self.file.append("\\b" + str(value) + " ")
 
     def print_bytex(self, value, pretty_print=None):
         value = self.prepare_byte(value)
         if pretty_print is not None:
-            self.file.write(pretty_print + " ")
+            self.file.append(pretty_print + " ")
             return
-        self.file.write("{:02X} ".format(value))
+        self.file.append(_HEXBYTE[value])
 
     def print_word(self, value):
         value = self.prepare_word(value)
-        self.file.write("\\w{:d} ".format(value))
+        self.file.append("\\w{:d} ".format(value))
 
     def print_wordx(self, value):
         value = self.prepare_word(value)
-        self.file.write("\\wx{:04X} ".format(value))
+        text = _hexword.get(value)
+        if text is None:
+            text = _hexword[value] = "\\wx{:04X} ".format(value)
+        self.file.append(text)
 
     def print_dword(self, value):
         value = self.prepare_dword(value)
-        self.file.write("\\d{:d} ".format(value))
+        self.file.append("\\d{:d} ".format(value))
 
     def print_dwordx(self, value):
         value = self.prepare_dword(value)
-        self.file.write("\\dx{:08X} ".format(value))
+        self.file.append("\\dx{:08X} ".format(value))
 
     def print_string(self, value, final_zero=True, force_ascii=False):
         assert self.in_sprite
-        self.file.write('"')
-        if not grfstrings.is_ascii_string(value):
-            if force_ascii:
-                raise generic.ScriptError("Expected ascii string but got a unicode string")
-            self.file.write("Þ")  # b'\xC3\x9E'.decode('utf-8')
-        self.file.write(value.replace('"', '\\"'))
-        self.byte_count += grfstrings.get_string_size(value, final_zero, force_ascii)
-        self.file.write('" ')
+        is_ascii, size = _string_info(value, force_ascii)
+        self.file.append('"')
+        if not is_ascii:
+            self.file.append("Þ")  # b'\xC3\x9E'.decode('utf-8')
+        self.file.append(value.replace('"', '\\"'))
+        self.byte_count += size
+        self.file.append('" ')
         if final_zero:
             self.print_bytex(0)
-            # get_string_size already includes the final 0 byte
-            # but print_bytex also increases byte_count, so decrease
-            # it here by one to correct it.
-            self.byte_count -= 1
 
     def print_decimal(self, value):
         assert self.in_sprite
-        self.file.write(str(value) + " ")
+        self.file.append(f"{value} ")
 
     def newline(self, msg="", prefix="\t"):
         if msg != "":
             msg = prefix + "// " + msg
-        self.file.write(msg + "\n")
+        self.file.append(msg + "\n")
 
     def comment(self, msg):
-        self.file.write("// " + msg + "\n")
+        self.file.append("// " + msg + "\n")
 
     def start_sprite(self, size, is_real_sprite=False):
         output_base.SpriteOutputBase.start_sprite(self, size, is_real_sprite)
         self.print_decimal(self.sprite_num)
         self.sprite_num += 1
         if not is_real_sprite:
-            self.file.write("* ")
+            self.file.append("* ")
             self.print_decimal(size)
 
     def print_sprite(self, sprite_list):
@@ -129,31 +145,23 @@ class OutputNFO(output_base.SpriteOutputBase):
         @type  sprite_list: C{list} of L{RealSprite}
         """
         self.start_sprite(0, True)
+        write = self.file.append
         for i, sprite_info in enumerate(sprite_list):
-            self.file.write(sprite_info.file.value + " ")
-            self.file.write(bit_depths[sprite_info.bit_depth] + " ")
-            self.print_decimal(sprite_info.xpos.value)
-            self.print_decimal(sprite_info.ypos.value)
-            self.print_decimal(sprite_info.xsize.value)
-            self.print_decimal(sprite_info.ysize.value)
-            self.print_decimal(sprite_info.xrel.value)
-            self.print_decimal(sprite_info.yrel.value)
-            self.file.write(zoom_levels[sprite_info.zoom_level] + " ")
-            if (sprite_info.flags.value & real_sprite.FLAG_NOCROP) != 0:
-                self.file.write("nocrop ")
+            nocrop = "nocrop " if (sprite_info.flags.value & real_sprite.FLAG_NOCROP) != 0 else ""
+            write(
+                f"{sprite_info.file.value} {bit_depths[sprite_info.bit_depth]}"
+                f"{sprite_info.xpos.value} {sprite_info.ypos.value} "
+                f"{sprite_info.xsize.value} {sprite_info.ysize.value} "
+                f"{sprite_info.xrel.value} {sprite_info.yrel.value} "
+                f"{zoom_levels[sprite_info.zoom_level]}{nocrop}"
+            )
             if sprite_info.mask_file is not None:
-                self.newline()
-                self.file.write("|\t")
-                self.file.write(sprite_info.mask_file.value)
-                self.file.write(" mask ")
                 mask_x, mask_y = (
                     sprite_info.mask_pos if sprite_info.mask_pos is not None else (sprite_info.xpos, sprite_info.ypos)
                 )
-                self.print_decimal(mask_x.value)
-                self.print_decimal(mask_y.value)
+                write(f"\n|\t{sprite_info.mask_file.value} mask {mask_x.value} {mask_y.value} ")
             if i + 1 < len(sprite_list):
-                self.newline()
-                self.file.write("|\t")
+                write("\n|\t")
         self.end_sprite()
 
     def print_empty_realsprite(self):
@@ -163,5 +171,5 @@ class OutputNFO(output_base.SpriteOutputBase):
 
     def print_named_filedata(self, filename):
         self.start_sprite(0, True)
-        self.file.write("** " + filename)
+        self.file.append("** " + filename)
         self.end_sprite()